@@ -4,8 +4,15 @@ Unit tests for MCP Type Safety Validator
 Run with: python -m pytest test_validator.py -v
 """
 
+import json
+import re
+import threading
+from collections import OrderedDict
+from enum import Enum
+
 import pytest
 from validator import (
+    FIELD_PATTERNS,
     Severity,
     ValidationResult,
     ValidationReport,
@@ -19,9 +26,13 @@ from validator import (
     try_coerce,
     validate_tool_arguments,
     check_response_types,
+    check_response_types_batch,
     generate_migration_script,
     format_report_text,
     format_session_report,
+    _split_field_pattern,
+    _TYPE_MAP,
+    _TYPE_MAP_LIMIT,
 )
 
 
@@ -62,6 +73,43 @@ class TestGetActualType:
         assert get_actual_type(True) != "integer"
         assert get_actual_type(False) != "integer"
 
+    def test_subclass_types(self):
+        """Subclasses of JSON types resolve to their base JSON type"""
+        from collections import OrderedDict
+        assert get_actual_type(OrderedDict()) == "object"
+        assert get_actual_type(OrderedDict()) == "object"  # cached lookup
+        assert get_actual_type(Severity.WARNING) == "unknown"
+        assert get_actual_type(()) == "unknown"
+
+    def test_class_proxy_not_cached(self):
+        """Objects that report a different __class__ are resolved per value"""
+        class Proxy:
+            def __init__(self, target):
+                self._target = target
+
+            @property
+            def __class__(self):
+                return type(self._target)
+
+        assert get_actual_type(Proxy({})) == "object"
+        assert get_actual_type(Proxy([])) == "array"
+        assert Proxy not in _TYPE_MAP
+
+    def test_unknown_types_not_cached(self):
+        """Non-JSON types don't grow the type lookup table"""
+        class Opaque:
+            pass
+
+        assert get_actual_type(Opaque()) == "unknown"
+        assert Opaque not in _TYPE_MAP
+
+    def test_runtime_subclasses_bounded(self):
+        """Classes created per call don't grow the type lookup table forever"""
+        for i in range(_TYPE_MAP_LIMIT + 10):
+            subclass = type(f"Record{i}", (dict,), {})
+            assert get_actual_type(subclass()) == "object"
+        assert len(_TYPE_MAP) <= _TYPE_MAP_LIMIT
+
 
 class TestInferTypeFromFieldName:
     """Tests for infer_type_from_field_name function"""
@@ -97,6 +145,37 @@ class TestInferTypeFromFieldName:
         assert infer_type_from_field_name("data") is None
         assert infer_type_from_field_name("value") is None
 
+    def test_matches_field_pattern_regexes(self):
+        """Literal lookup tables agree with the FIELD_PATTERNS regexes"""
+        names = [
+            "paid", "ID", "idx", "num", "Created", "my_timestamp_field",
+            "costly", "x_percent_y", "rate", "is", "has_", "flag", "x_flag",
+        ]
+        for name in names:
+            expected = None
+            for t, patterns in FIELD_PATTERNS.items():
+                if any(re.match(p, name, re.IGNORECASE) for p in patterns):
+                    expected = t
+                    break
+            assert infer_type_from_field_name(name) == expected, name
+
+    def test_pattern_classification(self):
+        """Anchored literals become string tests; anything else stays a regex"""
+        assert _split_field_pattern(r"^id$") == ("exact", "id")
+        assert _split_field_pattern(r".*Id$") == ("suffix", "id")
+        assert _split_field_pattern(r"^is_.*") == ("prefix", "is_")
+        assert _split_field_pattern(r".*amount.*") == ("contains", "amount")
+        assert _split_field_pattern(r"^n\d+$") == ("regex", r"^n\d+$")
+
+    def test_implicit_anchor_classification(self):
+        """re.match anchors at the start, so these are literal tests too"""
+        assert _split_field_pattern(r"^is_") == ("prefix", "is_")
+        assert _split_field_pattern(r"has_") == ("prefix", "has_")
+        assert _split_field_pattern(r"id$") == ("exact", "id")
+        assert _split_field_pattern(r".*amount") == ("contains", "amount")
+        assert _split_field_pattern(r"^.*") == ("regex", r"^.*")
+        assert _split_field_pattern(r"x\$") == ("regex", r"x\$")
+
 
 class TestLooksLikeUnixTimestamp:
     """Tests for looks_like_unix_timestamp function"""
@@ -134,6 +213,16 @@ class TestLooksLikeIso8601:
         assert looks_like_iso8601("January 1, 2024") is False
         assert looks_like_iso8601("1704067200") is False
 
+    def test_near_miss_formats(self):
+        assert looks_like_iso8601("") is False
+        assert looks_like_iso8601("2024-1-01") is False
+        assert looks_like_iso8601("2024-01-01T") is False
+        assert looks_like_iso8601("2024-01-01T12:30") is False
+        assert looks_like_iso8601("2024-01-01X12:30:45") is False
+        assert looks_like_iso8601("2024-01-01T12-30-45") is False
+        # Stricter than the old regex, whose "$" matched before a newline
+        assert looks_like_iso8601("2024-01-01\n") is False
+
 
 class TestLooksLikeCentsString:
     """Tests for looks_like_cents_string function"""
@@ -149,6 +238,7 @@ class TestLooksLikeCentsString:
     def test_non_numeric_string(self):
         assert looks_like_cents_string("abc", "amount") is False
         assert looks_like_cents_string("15.99", "amount") is False
+        assert looks_like_cents_string("1599\n", "amount") is False
 
 
 class TestDetectPattern:
@@ -183,6 +273,12 @@ class TestDetectPattern:
         assert detect_pattern("field", "", "string") == "null_handling"
         assert detect_pattern("field", "null", "string") == "null_handling"
 
+    def test_union_expected_type(self):
+        """Union types only match the checks that ignore the expected type"""
+        assert detect_pattern("total_amount", "1599", ["string", "null"]) == "amount_format"
+        assert detect_pattern("field", None, ["string", "null"]) == "null_handling"
+        assert detect_pattern("user_id", "123", ["integer", "null"]) is None
+
 
 class TestTryCoerce:
     """Tests for try_coerce function"""
@@ -254,6 +350,13 @@ class TestTryCoerce:
         assert success is True
         assert value == "123"
 
+    def test_union_target_type(self):
+        """Union (list) targets are reported as not coercible, not raised"""
+        success, value, msg = try_coerce("5", ["integer", "null"])
+        assert success is False
+        assert value == "5"
+        assert "Cannot coerce" in msg
+
 
 class TestValidateToolArguments:
     """Tests for validate_tool_arguments function"""
@@ -305,6 +408,12 @@ class TestValidateToolArguments:
         assert report.valid is False
         assert len(report.errors) == 1
         assert "missing" in report.errors[0].message.lower()
+        assert report.errors[0].expected_type == "string"
+
+    def test_no_arguments(self):
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+        assert validate_tool_arguments("test", {}, schema).valid is True
+        assert validate_tool_arguments("test", {}, None).valid is True
 
     def test_unknown_field_suggestion(self):
         schema = {
@@ -351,6 +460,91 @@ class TestValidateToolArguments:
         assert len(report.warnings) == 1
         assert report.auto_fixes.get("created_at") == 1704067200
 
+    def test_schema_reused_across_calls(self):
+        """Repeated calls with one schema dict and with fresh dicts agree"""
+        schema = {
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer"}
+            }
+        }
+        for _ in range(3):
+            report = validate_tool_arguments("test", {"count": "abc"}, schema)
+            assert report.valid is False
+
+        for expected_type in ("string", "integer"):
+            fresh = {"properties": {"count": {"type": expected_type}}}
+            report = validate_tool_arguments("test", {"count": 5}, fresh)
+            assert len(report.warnings) == (expected_type == "string")
+
+    def test_schema_mutation_not_picked_up(self):
+        """Schemas are indexed once; edits need a new dict (documented)"""
+        schema = {"properties": {"count": {"type": "integer"}}}
+        assert validate_tool_arguments("test", {"count": 5}, schema).valid is True
+
+        schema["properties"]["count"]["type"] = "string"
+        report = validate_tool_arguments("test", {"count": 5}, schema)
+        assert len(report.warnings) == 0
+
+        edited = {"properties": {"count": {"type": "string"}}}
+        report = validate_tool_arguments("test", {"count": 5}, edited)
+        assert len(report.warnings) == 1
+
+    def test_schema_cache_thread_safe(self, monkeypatch):
+        """A schema evicted by another thread mid-lookup doesn't raise"""
+        schema = {"properties": {"count": {"type": "integer"}}}
+        others = [{"properties": {"count": {"type": "integer"}}} for _ in range(300)]
+        caller = threading.current_thread()
+        armed = []
+        workers = []
+
+        def evict_all():
+            for other in others:
+                check_response_types({"count": 1}, other)
+
+        class RacingCache(OrderedDict):
+            def get(self, key, default=None):
+                result = super().get(key, default)
+                if armed and threading.current_thread() is caller:
+                    armed.clear()
+                    # Another thread churns the cache between this lookup
+                    # and the recency update that follows it
+                    worker = threading.Thread(target=evict_all)
+                    workers.append(worker)
+                    worker.start()
+                    worker.join(timeout=0.2)
+                return result
+
+        monkeypatch.setattr("validator._SCHEMA_CACHE", RacingCache())
+        check_response_types({"count": 1}, schema)
+        armed.append(True)
+
+        report = check_response_types({"count": 1}, schema)
+        for worker in workers:
+            worker.join()
+        assert report.valid is True
+
+    def test_str_enum_schema_types(self):
+        """Schema types given as str Enum members behave like plain strings"""
+        class JsonType(str, Enum):
+            INTEGER = "integer"
+            STRING = "string"
+            NULL = "null"
+
+        schema = {
+            "type": "object",
+            "properties": {
+                "count": {"type": JsonType.INTEGER},
+                "name": {"type": [JsonType.STRING, JsonType.NULL]}
+            }
+        }
+        report = validate_tool_arguments("test", {"count": 5, "name": None}, schema)
+        assert report.valid is True
+        assert len(report.warnings) == 0
+
+        report = validate_tool_arguments("test", {"count": "5"}, schema)
+        assert report.auto_fixes["count"] == 5
+
 
 class TestCheckResponseTypes:
     """Tests for check_response_types function"""
@@ -387,6 +581,36 @@ class TestCheckResponseTypes:
         assert report.valid is True
 
 
+class TestCheckResponseTypesBatch:
+    """Tests for check_response_types_batch function"""
+
+    def test_matches_per_record_check(self):
+        schema = {
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": ["string", "null"]}
+            }
+        }
+        records = [
+            {"id": 1, "name": "a"},
+            {"id": "2", "name": None},
+            {"name": 3},
+            "not a dict",
+        ]
+        reports = check_response_types_batch(records, schema)
+        assert len(reports) == len(records)
+        for record, report in zip(records, reports):
+            assert report.to_dict() == check_response_types(record, schema).to_dict()
+        assert len(reports[0].warnings) == 0
+        assert reports[1].warnings[0].field == "id"
+        assert reports[2].warnings[0].field == "name"
+
+    def test_no_schema(self):
+        reports = check_response_types_batch([{"any": "data"}], None)
+        assert len(reports) == 1
+        assert reports[0].valid is True
+
+
 class TestSessionStats:
     """Tests for SessionStats class"""
 
@@ -561,4 +785,8 @@ class TestValidationReportToDict:
         report.auto_fixes["test"] = 123
         result = report.to_dict()
         assert len(result["warnings"]) == 1
+        assert result["warnings"][0]["field"] == "test"
+        assert result["warnings"][0]["actual_type"] == "str"
+        assert result["warnings"][0]["severity"] == "warning"
         assert result["auto_fixes"]["test"] == 123
+        json.dumps(result)
@@ -6,9 +6,13 @@ Provides type checking, pattern detection, and migration assistance.
 """
 
 import re
+import sys
 import json
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -21,7 +25,7 @@ class Severity(Enum):
     SUGGESTION = "suggestion"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a single field validation"""
     field: str
@@ -33,8 +37,20 @@ class ValidationResult:
     suggestion: Optional[str] = None
     auto_fix: Optional[Any] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "field": self.field,
+            "severity": self.severity.value,
+            "message": self.message,
+            "value": self.value,
+            "expected_type": self.expected_type,
+            "actual_type": self.actual_type,
+            "suggestion": self.suggestion,
+            "auto_fix": self.auto_fix
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationReport:
     """Complete validation report for a tool call"""
     valid: bool
@@ -46,14 +62,14 @@ class ValidationReport:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "valid": self.valid,
-            "warnings": [w.__dict__ for w in self.warnings],
-            "errors": [e.__dict__ for e in self.errors],
-            "suggestions": [s.__dict__ for s in self.suggestions],
+            "warnings": [w.to_dict() for w in self.warnings],
+            "errors": [e.to_dict() for e in self.errors],
+            "suggestions": [s.to_dict() for s in self.suggestions],
             "auto_fixes": self.auto_fixes
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Track validation statistics across a session"""
     total_calls: int = 0
@@ -71,10 +87,11 @@ class SessionStats:
 
     def safety_score(self) -> float:
         """Calculate type safety score (0-100)"""
-        if self.total_calls == 0:
+        total = self.total_calls
+        if not total:
             return 100.0
-        clean_calls = self.total_calls - self.warnings_issued - self.errors_prevented
-        return max(0, (clean_calls / self.total_calls) * 100)
+        score = (total - self.warnings_issued - self.errors_prevented) / total * 100
+        return score if score > 0.0 else 0.0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -111,32 +128,122 @@ FIELD_PATTERNS = {
 }
 
 
+def _split_field_pattern(pattern: str) -> Tuple[str, str]:
+    """
+    Classify a FIELD_PATTERNS regex as a plain string test.
+    Returns: (kind, literal) where kind is "exact", "prefix", "suffix",
+    "contains", or "regex" when the pattern is not an anchored literal.
+    """
+    # re.match is anchored at the start, so a leading "^" is redundant
+    body = pattern[1:] if pattern.startswith("^") else pattern
+    anywhere = body.startswith(".*")
+    if anywhere:
+        body = body[2:]
+    to_end = body.endswith("$")
+    if to_end:
+        body = body[:-1]
+    elif body.endswith(".*"):
+        body = body[:-2]
+
+    if not body or re.escape(body) != body:
+        return "regex", pattern
+    if anywhere:
+        return ("suffix" if to_end else "contains"), body.lower()
+    return ("exact" if to_end else "prefix"), body.lower()
+
+
+def _build_field_rules() -> List[Tuple[str, frozenset, tuple, tuple, tuple, Optional[re.Pattern]]]:
+    """Turn FIELD_PATTERNS into per-type literal tables, in priority order"""
+    rules = []
+    for expected_type, patterns in FIELD_PATTERNS.items():
+        tests: Dict[str, list] = {
+            "exact": [], "prefix": [], "suffix": [], "contains": [], "regex": []
+        }
+        for pattern in patterns:
+            kind, literal = _split_field_pattern(pattern)
+            tests[kind].append(literal)
+        rules.append((
+            expected_type,
+            frozenset(tests["exact"]),
+            tuple(dict.fromkeys(tests["prefix"])),
+            tuple(dict.fromkeys(tests["suffix"])),
+            tuple(dict.fromkeys(tests["contains"])),
+            # Remaining patterns fused into one alternation, one match per call
+            re.compile("|".join(f"(?:{p})" for p in tests["regex"]), re.IGNORECASE)
+            if tests["regex"] else None,
+        ))
+    return rules
+
+
+_FIELD_RULES = _build_field_rules()
+
+
+# Exact Python type -> JSON type name (bool is keyed separately from int);
+# subclasses are added by get_actual_type when first seen, up to _TYPE_MAP_LIMIT
+_TYPE_MAP = {
+    type(None): "null",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
+# Largest size get_actual_type grows _TYPE_MAP to; subclasses created at runtime
+# beyond this are resolved on every call instead of being kept alive here
+_TYPE_MAP_LIMIT = 64
+
+# JSON type name -> exact Python type, from the built-in entries above
+_PYTHON_TYPES = {json_type: python_type for python_type, json_type in _TYPE_MAP.items()}
+
+
+class _Missing:
+    """Placeholder for a field absent from a response record"""
+
+
+_MISSING = _Missing()
+
+
 def get_actual_type(value: Any) -> str:
     """Get the JSON type name for a Python value"""
-    if value is None:
-        return "null"
-    elif isinstance(value, bool):
-        return "boolean"
+    value_type = type(value)
+    actual_type = _TYPE_MAP.get(value_type)
+    if actual_type is not None:
+        return actual_type
+    # Subclasses (OrderedDict, IntEnum, ...) are resolved once, then cached
+    if isinstance(value, bool):
+        actual_type = "boolean"
     elif isinstance(value, int):
-        return "integer"
+        actual_type = "integer"
     elif isinstance(value, float):
-        return "number"
+        actual_type = "number"
     elif isinstance(value, str):
-        return "string"
+        actual_type = "string"
     elif isinstance(value, list):
-        return "array"
+        actual_type = "array"
     elif isinstance(value, dict):
-        return "object"
+        actual_type = "object"
     else:
         return "unknown"
+    # Proxies that fake __class__ and non-JSON types are never cached, and
+    # subclasses only until the table is full
+    if value.__class__ is value_type and len(_TYPE_MAP) < _TYPE_MAP_LIMIT:
+        _TYPE_MAP[value_type] = actual_type
+    return actual_type
 
 
+@lru_cache(maxsize=4096)
 def infer_type_from_field_name(field_name: str) -> Optional[str]:
     """Infer expected type from field name patterns"""
-    for expected_type, patterns in FIELD_PATTERNS.items():
-        for pattern in patterns:
-            if re.match(pattern, field_name, re.IGNORECASE):
-                return expected_type
+    name = field_name.lower()
+    for expected_type, exact, prefixes, suffixes, contains, pattern in _FIELD_RULES:
+        if (name in exact
+                or name.startswith(prefixes)
+                or name.endswith(suffixes)
+                or any(literal in name for literal in contains)
+                or (pattern is not None and pattern.match(field_name))):
+            return expected_type
     return None
 
 
@@ -144,63 +251,218 @@ def looks_like_unix_timestamp(value: int) -> bool:
     """Check if an integer looks like a Unix timestamp"""
     # Unix seconds: 1000000000 to 2500000000 (roughly 2001 to 2049)
     # Unix milliseconds: 1000000000000 to 2500000000000
-    return (1_000_000_000 <= value <= 2_500_000_000 or
-            1_000_000_000_000 <= value <= 2_500_000_000_000)
+    # One outer range test rejects most non-timestamp integers (small counts,
+    # IDs) before the gap between the two windows is checked
+    return (1_000_000_000 <= value <= 2_500_000_000_000 and
+            (value <= 2_500_000_000 or value >= 1_000_000_000_000))
 
 
 def looks_like_iso8601(value: str) -> bool:
     """Check if a string looks like an ISO-8601 timestamp"""
-    iso_patterns = [
-        r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}",  # Basic ISO-8601
-        r"^\d{4}-\d{2}-\d{2}$",  # Date only
-        r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",  # Space separator
-    ]
-    return any(re.match(p, value) for p in iso_patterns)
+    # YYYY-MM-DD, optionally followed by "T" or " " and HH:MM:SS
+    n = len(value)
+    if n < 10 or value[4] != "-" or value[7] != "-":
+        return False
+    if not (value[:4].isdecimal() and value[5:7].isdecimal() and value[8:10].isdecimal()):
+        return False
+    if n == 10:
+        return True
+    return (n >= 19 and value[10] in "T " and value[13] == ":" and value[16] == ":"
+            and value[11:13].isdecimal() and value[14:16].isdecimal()
+            and value[17:19].isdecimal())
+
+
+# Field name fragments that suggest a monetary amount
+_MONEY_WORDS = ("amount", "price", "cost", "total", "fee", "charge")
+_MONEY_RE = re.compile("|".join(map(re.escape, _MONEY_WORDS)))
+
+
+@lru_cache(maxsize=4096)
+def _field_name_traits(field_name: str) -> Tuple[bool, bool]:
+    """
+    Name-only facts used by pattern detection, lowercasing the name once.
+    Returns: (refers to an identifier, suggests a monetary amount)
+    """
+    name = field_name.lower()
+    return "id" in name, _MONEY_RE.search(name) is not None
 
 
 def looks_like_cents_string(value: str, field_name: str) -> bool:
     """Check if a string looks like cents (for amount fields)"""
-    if not re.match(r"^\d+$", value):
+    # isdecimal() accepts the same characters as \d
+    return value.isdecimal() and _field_name_traits(field_name)[1]
+
+
+# Literal values recognised as boolean or null variants (1.0 and True hash
+# equal to 1, matching the list membership these replace)
+_BOOLEAN_VARIANTS = frozenset(["true", "false", "True", "False", "1", "0", 1, 0])
+_NULL_VARIANTS = frozenset([None, "", "null", "undefined", "None"])
+_TRUTHY_VALUES = frozenset([1, "1", "true", "True", "yes", "Yes"])
+_FALSY_VALUES = frozenset([0, "0", "false", "False", "no", "No"])
+
+
+def _check_unix_timestamp(field_name: str, value: Any) -> bool:
+    """Integer that looks like a Unix timestamp"""
+    return looks_like_unix_timestamp(value)
+
+
+def _check_iso8601(field_name: str, value: Any) -> bool:
+    """String that looks like an ISO-8601 date"""
+    return looks_like_iso8601(value)
+
+
+def _check_id_field(field_name: str, value: Any) -> bool:
+    """Value in a field named like an ID"""
+    return _field_name_traits(field_name)[0]
+
+
+def _check_cents_string(field_name: str, value: Any) -> bool:
+    """Numeric string in a money field (likely cents)"""
+    return looks_like_cents_string(value, field_name)
+
+
+def _check_boolean_variant(field_name: str, value: Any) -> bool:
+    """Non-boolean spelling of true/false ("true", 1, ...)"""
+    try:
+        return value in _BOOLEAN_VARIANTS
+    except TypeError:
+        # Unhashable value of an unknown type
         return False
-    # Check if field name suggests money
-    money_patterns = ["amount", "price", "cost", "total", "fee", "charge"]
-    return any(p in field_name.lower() for p in money_patterns)
+
+
+def _check_null_variant(field_name: str, value: Any) -> bool:
+    """Null-like value (None, "", "null", ...)"""
+    return value in _NULL_VARIANTS
+
+
+# (pattern, actual types, expected types, check) in priority order; None matches any type
+_PATTERN_RULES = [
+    # Timestamp confusion
+    ("timestamp_mismatch", ("integer",), ("string",), _check_unix_timestamp),
+    ("timestamp_mismatch", ("string",), ("integer",), _check_iso8601),
+    # ID type mismatch
+    ("id_type_mismatch", ("string",), ("integer",), _check_id_field),
+    # Amount format
+    ("amount_format", ("string",), None, _check_cents_string),
+    # Boolean variants (True/1.0 compare equal to 1)
+    ("boolean_variant", ("string", "integer", "number", "boolean", "unknown"), ("boolean",),
+     _check_boolean_variant),
+    # Null handling
+    ("null_handling", ("null", "string"), None, _check_null_variant),
+]
+
+
+@lru_cache(maxsize=256)
+def _pattern_checks(actual_type: str, expected_type: Optional[str]) -> Tuple[Tuple[str, Callable], ...]:
+    """Select the pattern checks that can apply to an (actual, expected) type pair"""
+    return tuple(
+        (pattern, check)
+        for pattern, actual_types, expected_types, check in _PATTERN_RULES
+        if (actual_types is None or actual_type in actual_types)
+        and (expected_types is None or expected_type in expected_types)
+    )
 
 
 def detect_pattern(field_name: str, value: Any, expected_type: str) -> Optional[str]:
     """Identify common type mismatch patterns"""
-    actual_type = get_actual_type(value)
+    # Union (list) and other non-string types only match the checks that
+    # don't depend on the expected type
+    if not isinstance(expected_type, str):
+        expected_type = None
+    for pattern, check in _pattern_checks(get_actual_type(value), expected_type):
+        if check(field_name, value):
+            return pattern
+    return None
 
-    # Timestamp confusion
-    if expected_type == "string" and actual_type == "integer":
-        if looks_like_unix_timestamp(value):
-            return "timestamp_mismatch"
 
-    if expected_type == "integer" and actual_type == "string":
-        if looks_like_iso8601(value):
-            return "timestamp_mismatch"
+@lru_cache(maxsize=1024)
+def _iso8601_to_unix(value: str) -> int:
+    """Convert an ISO-8601 string to Unix seconds (raises ValueError)"""
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return int(dt.timestamp())
 
-    # ID type mismatch
-    if "id" in field_name.lower():
-        if expected_type == "integer" and actual_type == "string":
-            return "id_type_mismatch"
 
-    # Amount format
-    if actual_type == "string" and looks_like_cents_string(value, field_name):
-        return "amount_format"
+@lru_cache(maxsize=1024)
+def _unix_to_iso8601(value: int) -> str:
+    """Convert Unix seconds or milliseconds to an ISO-8601 UTC string"""
+    ts = value / 1000 if value > 1e11 else value
+    iso_str = datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+    return iso_str[:-6] + "Z" if iso_str.endswith("+00:00") else iso_str
 
-    # Boolean variants
-    if expected_type == "boolean":
-        if value in ["true", "false", "True", "False", "1", "0", 1, 0]:
-            return "boolean_variant"
 
-    # Null handling
-    if value in [None, "", "null", "undefined", "None"]:
-        return "null_handling"
+def _coerce_string_to_integer(value: str) -> Tuple[bool, Any, str]:
+    """String to integer, converting ISO-8601 dates to Unix timestamps"""
+    # Check for ISO-8601 timestamp FIRST before basic int()
+    if looks_like_iso8601(value):
+        try:
+            unix_ts = _iso8601_to_unix(value)
+            return True, unix_ts, f"Convert ISO-8601 to Unix timestamp: {unix_ts}"
+        except ValueError:
+            pass
+    # Then try basic integer conversion
+    try:
+        coerced = int(value)
+        return True, coerced, f'Convert string "{value}" to integer {coerced}'
+    except ValueError:
+        return False, value, f'Cannot convert "{value}" to integer'
+
 
+def _coerce_string_to_number(value: str) -> Tuple[bool, Any, str]:
+    """String to number"""
+    try:
+        coerced = float(value)
+        return True, coerced, f'Convert string "{value}" to number {coerced}'
+    except ValueError:
+        return False, value, f'Cannot convert "{value}" to number'
+
+
+def _coerce_integer_to_number(value: int) -> Tuple[bool, Any, str]:
+    """Integer to number (always valid)"""
+    return True, float(value), "Integer is valid as number"
+
+
+def _coerce_to_boolean(value: Any) -> Optional[Tuple[bool, Any, str]]:
+    """Boolean variant to bool; None when the value isn't one"""
+    try:
+        if value in _TRUTHY_VALUES:
+            return True, True, f'Convert "{value}" to true'
+        if value in _FALSY_VALUES:
+            return True, False, f'Convert "{value}" to false'
+    except TypeError:
+        # Unhashable value of an unknown type
+        pass
     return None
 
 
+def _coerce_number_to_string(value: Any) -> Tuple[bool, Any, str]:
+    """Number to its string form"""
+    return True, str(value), f"Convert {value} to string"
+
+
+def _coerce_integer_to_string(value: int) -> Tuple[bool, Any, str]:
+    """Integer to string, converting Unix timestamps to ISO-8601"""
+    # Check Unix timestamp FIRST before basic str()
+    if looks_like_unix_timestamp(value):
+        iso_str = _unix_to_iso8601(value)
+        return True, iso_str, f"Convert Unix timestamp to ISO-8601: {iso_str}"
+    return _coerce_number_to_string(value)
+
+
+# (actual type, target type) -> coercer; a coercer returning None falls
+# through to the generic "Cannot coerce" result
+_COERCERS = {
+    ("string", "integer"): _coerce_string_to_integer,
+    ("string", "number"): _coerce_string_to_number,
+    ("integer", "number"): _coerce_integer_to_number,
+    ("string", "boolean"): _coerce_to_boolean,
+    ("integer", "boolean"): _coerce_to_boolean,
+    ("number", "boolean"): _coerce_to_boolean,
+    ("unknown", "boolean"): _coerce_to_boolean,
+    ("integer", "string"): _coerce_integer_to_string,
+    ("number", "string"): _coerce_number_to_string,
+}
+
+
 def try_coerce(value: Any, target_type: str) -> Tuple[bool, Any, str]:
     """
     Attempt to coerce a value to target type.
@@ -211,57 +473,94 @@ def try_coerce(value: Any, target_type: str) -> Tuple[bool, Any, str]:
     if actual_type == target_type:
         return True, value, "Types match"
 
-    # String to integer - check ISO-8601 FIRST before basic int()
-    if target_type == "integer" and actual_type == "string":
-        # Check for ISO-8601 timestamp first
-        if looks_like_iso8601(value):
-            try:
-                dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-                unix_ts = int(dt.timestamp())
-                return True, unix_ts, f"Convert ISO-8601 to Unix timestamp: {unix_ts}"
-            except ValueError:
-                pass
-        # Then try basic integer conversion
-        try:
-            coerced = int(value)
-            return True, coerced, f'Convert string "{value}" to integer {coerced}'
-        except ValueError:
-            return False, value, f'Cannot convert "{value}" to integer'
+    # Union (list) targets are unhashable and never match a single coercer
+    coercer = _COERCERS.get((actual_type, target_type)) if isinstance(target_type, str) else None
+    if coercer is not None:
+        result = coercer(value)
+        if result is not None:
+            return result
 
-    # String to number
-    if target_type == "number" and actual_type == "string":
-        try:
-            coerced = float(value)
-            return True, coerced, f'Convert string "{value}" to number {coerced}'
-        except ValueError:
-            return False, value, f'Cannot convert "{value}" to number'
+    return False, value, f"Cannot coerce {actual_type} to {target_type}"
 
-    # Integer to number (always valid)
-    if target_type == "number" and actual_type == "integer":
-        return True, float(value), "Integer is valid as number"
 
-    # Boolean variants
-    if target_type == "boolean":
-        if value in [1, "1", "true", "True", "yes", "Yes"]:
-            return True, True, f'Convert "{value}" to true'
-        if value in [0, "0", "false", "False", "no", "No"]:
-            return True, False, f'Convert "{value}" to false'
+@lru_cache(maxsize=256)
+def _union_coercers(actual_type: str, allowed_types: frozenset) -> Tuple[Callable, ...]:
+    """Select the coercers that could turn actual_type into one of a union's types"""
+    return tuple(
+        _COERCERS[(actual_type, t)]
+        for t in allowed_types
+        if (actual_type, t) in _COERCERS
+    )
 
-    # Integer to string - check Unix timestamp FIRST before basic str()
-    if target_type == "string" and actual_type == "integer":
-        if looks_like_unix_timestamp(value):
-            # Convert Unix timestamp to ISO-8601
-            ts = value / 1000 if value > 1e11 else value
-            dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-            iso_str = dt.isoformat().replace("+00:00", "Z")
-            return True, iso_str, f"Convert Unix timestamp to ISO-8601: {iso_str}"
-        # Fall through to basic string conversion below
 
-    # Number/Integer to string (basic conversion)
-    if target_type == "string" and actual_type in ["integer", "number"]:
-        return True, str(value), f"Convert {value} to string"
+def _can_coerce_to_union(value: Any, actual_type: str, allowed_types: frozenset) -> bool:
+    """Check if a value of actual_type can be coerced to any allowed type"""
+    for coercer in _union_coercers(actual_type, allowed_types):
+        result = coercer(value)
+        if result is not None and result[0]:
+            return True
+    return False
 
-    return False, value, f"Cannot coerce {actual_type} to {target_type}"
+
+@dataclass(frozen=True, slots=True)
+class _CompiledSchema:
+    """JSON Schema preprocessed into per-field type lookups"""
+    # field name -> (declared "type" value, allowed JSON type names, is union)
+    properties: Dict[str, Tuple[Any, frozenset, bool]]
+    # (required field name, declared "type" reported when it is missing)
+    required: Tuple[Tuple[str, Any], ...]
+
+
+# id(schema) -> (schema, compiled), least recently used first; holding the
+# schema keeps its id from being reused while the entry is cached
+_SCHEMA_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], _CompiledSchema]]" = OrderedDict()
+_SCHEMA_CACHE_SIZE = 256
+# Guards _SCHEMA_CACHE; its reorder/evict steps are not atomic across threads
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
+def _intern_type(type_name: Any) -> Any:
+    """
+    Intern a schema type name so it shares identity with the type name
+    literals returned by get_actual_type, making comparisons pointer checks.
+    """
+    return sys.intern(type_name) if type(type_name) is str else type_name
+
+
+def _compile_schema(schema: Dict[str, Any]) -> _CompiledSchema:
+    """
+    Index a schema's properties once, reusing the result for the same dict.
+    Schemas are assumed not to be mutated after they are first used.
+    """
+    key = id(schema)
+    with _SCHEMA_CACHE_LOCK:
+        cached = _SCHEMA_CACHE.get(key)
+        if cached is not None and cached[0] is schema:
+            _SCHEMA_CACHE.move_to_end(key)
+            return cached[1]
+
+    schema_properties = schema.get("properties") or {}
+    properties = {}
+    for field_name, field_schema in schema_properties.items():
+        expected_type = _intern_type(field_schema.get("type"))
+        is_union = isinstance(expected_type, list)
+        if is_union:
+            allowed = frozenset(_intern_type(t) for t in expected_type)
+        else:
+            allowed = frozenset((expected_type,))
+        properties[field_name] = (expected_type, allowed, is_union)
+
+    required = tuple(
+        (req_field, schema_properties.get(req_field, {}).get("type", "unknown"))
+        for req_field in schema.get("required") or ()
+    )
+    compiled = _CompiledSchema(properties, required)
+    with _SCHEMA_CACHE_LOCK:
+        _SCHEMA_CACHE[key] = (schema, compiled)
+        _SCHEMA_CACHE.move_to_end(key)
+        if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+    return compiled
 
 
 def validate_tool_arguments(
@@ -275,13 +574,19 @@ def validate_tool_arguments(
     Args:
         tool_name: Name of the MCP tool being called
         arguments: Arguments being passed to the tool
-        schema: JSON Schema for the tool's input (optional)
+        schema: JSON Schema for the tool's input (optional). The schema is
+            indexed on first use and the index is reused for the same dict, so
+            don't mutate it afterwards; pass a new dict instead.
 
     Returns:
         ValidationReport with warnings, errors, and suggestions
     """
     report = ValidationReport(valid=True)
 
+    # Zero-argument calls (health checks etc.) only need the required check
+    if not arguments and not (schema and schema.get("required")):
+        return report
+
     if not schema:
         # No schema - use field name inference
         for field_name, value in arguments.items():
@@ -290,7 +595,6 @@ def validate_tool_arguments(
                 actual_type = get_actual_type(value)
                 if actual_type != inferred_type:
                     can_coerce, coerced, message = try_coerce(value, inferred_type)
-                    pattern = detect_pattern(field_name, value, inferred_type)
 
                     if can_coerce:
                         result = ValidationResult(
@@ -319,25 +623,26 @@ def validate_tool_arguments(
         return report
 
     # Validate against schema
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
+    compiled = _compile_schema(schema)
+    properties = compiled.properties
 
     # Check required fields
-    for req_field in required:
+    for req_field, req_type in compiled.required:
         if req_field not in arguments:
             report.errors.append(ValidationResult(
                 field=req_field,
                 severity=Severity.ERROR,
                 message=f"Required field '{req_field}' is missing",
                 value=None,
-                expected_type=properties.get(req_field, {}).get("type", "unknown"),
+                expected_type=req_type,
                 actual_type="missing"
             ))
             report.valid = False
 
     # Check each argument
     for field_name, value in arguments.items():
-        if field_name not in properties:
+        field_types = properties.get(field_name)
+        if field_types is None:
             # Unknown field - just note it
             report.suggestions.append(ValidationResult(
                 field=field_name,
@@ -350,63 +655,54 @@ def validate_tool_arguments(
             ))
             continue
 
-        field_schema = properties[field_name]
-        expected_type = field_schema.get("type")
+        expected_type, allowed_types, is_union = field_types
 
         if not expected_type:
             continue
 
-        # Handle multiple types
-        if isinstance(expected_type, list):
-            actual_type = get_actual_type(value)
-            if actual_type not in expected_type:
-                can_coerce = False
-                for t in expected_type:
-                    success, _, _ = try_coerce(value, t)
-                    if success:
-                        can_coerce = True
-                        break
-                if not can_coerce:
-                    report.errors.append(ValidationResult(
-                        field=field_name,
-                        severity=Severity.ERROR,
-                        message=f"Type '{actual_type}' not in allowed types {expected_type}",
-                        value=value,
-                        expected_type=str(expected_type),
-                        actual_type=actual_type
-                    ))
-                    report.valid = False
-            continue
-
         actual_type = get_actual_type(value)
+        if actual_type in allowed_types:
+            continue
 
-        if actual_type != expected_type:
-            can_coerce, coerced, message = try_coerce(value, expected_type)
-            pattern = detect_pattern(field_name, value, expected_type)
-
-            if can_coerce:
-                result = ValidationResult(
-                    field=field_name,
-                    severity=Severity.WARNING,
-                    message=message,
-                    value=value,
-                    expected_type=expected_type,
-                    actual_type=actual_type,
-                    auto_fix=coerced
-                )
-                report.warnings.append(result)
-                report.auto_fixes[field_name] = coerced
-            else:
-                result = ValidationResult(
+        # Handle multiple types
+        if is_union:
+            if not _can_coerce_to_union(value, actual_type, allowed_types):
+                report.errors.append(ValidationResult(
                     field=field_name,
                     severity=Severity.ERROR,
-                    message=message,
+                    message=f"Type '{actual_type}' not in allowed types {expected_type}",
                     value=value,
-                    expected_type=expected_type,
+                    expected_type=str(expected_type),
                     actual_type=actual_type
-                )
-                report.errors.append(result)
+                ))
                 report.valid = False
+            continue
+
+        can_coerce, coerced, message = try_coerce(value, expected_type)
+
+        if can_coerce:
+            result = ValidationResult(
+                field=field_name,
+                severity=Severity.WARNING,
+                message=message,
+                value=value,
+                expected_type=expected_type,
+                actual_type=actual_type,
+                auto_fix=coerced
+            )
+            report.warnings.append(result)
+            report.auto_fixes[field_name] = coerced
+        else:
+            result = ValidationResult(
+                field=field_name,
+                severity=Severity.ERROR,
+                message=message,
+                value=value,
+                expected_type=expected_type,
+                actual_type=actual_type
+            )
+            report.errors.append(result)
+            report.valid = False
 
     return report
 
@@ -420,7 +716,9 @@ def check_response_types(
 
     Args:
         response: Response data from MCP tool call
-        expected_schema: Expected JSON Schema for the response
+        expected_schema: Expected JSON Schema for the response. Indexed on
+            first use like the validate_tool_arguments schema; don't mutate it
+            afterwards.
 
     Returns:
         ValidationReport with any type issues found
@@ -430,29 +728,31 @@ def check_response_types(
     if not expected_schema or not isinstance(response, dict):
         return report
 
-    properties = expected_schema.get("properties", {})
+    properties = _compile_schema(expected_schema).properties
 
     for field_name, value in response.items():
-        if field_name not in properties:
+        field_types = properties.get(field_name)
+        if field_types is None:
             continue
 
-        expected_type = properties[field_name].get("type")
+        expected_type, allowed_types, is_union = field_types
         if not expected_type:
             continue
 
         actual_type = get_actual_type(value)
+        if actual_type in allowed_types:
+            continue
 
-        if isinstance(expected_type, list):
-            if actual_type not in expected_type:
-                report.warnings.append(ValidationResult(
-                    field=field_name,
-                    severity=Severity.WARNING,
-                    message=f"Response field '{field_name}' has unexpected type",
-                    value=value,
-                    expected_type=str(expected_type),
-                    actual_type=actual_type
-                ))
-        elif actual_type != expected_type:
+        if is_union:
+            report.warnings.append(ValidationResult(
+                field=field_name,
+                severity=Severity.WARNING,
+                message=f"Response field '{field_name}' has unexpected type",
+                value=value,
+                expected_type=str(expected_type),
+                actual_type=actual_type
+            ))
+        else:
             pattern = detect_pattern(field_name, value, expected_type)
             report.warnings.append(ValidationResult(
                 field=field_name,
@@ -467,6 +767,52 @@ def check_response_types(
     return report
 
 
+def check_response_types_batch(
+    responses: List[Any],
+    expected_schema: Optional[Dict[str, Any]] = None
+) -> List[ValidationReport]:
+    """
+    Check a list of responses (e.g. rows from a list endpoint) against one schema.
+
+    Each schema field is checked as a column across all records; only records
+    with a mismatched field are re-checked individually, so the reports match
+    calling check_response_types on every record.
+
+    Args:
+        responses: Response records from MCP tool calls
+        expected_schema: Expected JSON Schema for each record. Indexed on
+            first use like the validate_tool_arguments schema; don't mutate it
+            afterwards.
+
+    Returns:
+        One ValidationReport per record, in order
+    """
+    if not expected_schema:
+        return [ValidationReport(valid=True) for _ in responses]
+
+    rows = [i for i, record in enumerate(responses) if isinstance(record, dict)]
+    records = [responses[i] for i in rows]
+    dirty = set()
+
+    properties = _compile_schema(expected_schema).properties
+    for field_name, (expected_type, allowed_types, _) in properties.items():
+        if not expected_type:
+            continue
+        # Exact Python types that need no warning; absent fields are skipped
+        clean_types = {_Missing}
+        clean_types.update(_PYTHON_TYPES[t] for t in allowed_types if t in _PYTHON_TYPES)
+
+        column = [record.get(field_name, _MISSING) for record in records]
+        if set(map(type, column)) <= clean_types:
+            continue
+        dirty.update(rows[i] for i, value in enumerate(column) if type(value) not in clean_types)
+
+    return [
+        check_response_types(record, expected_schema) if i in dirty else ValidationReport(valid=True)
+        for i, record in enumerate(responses)
+    ]
+
+
 def generate_migration_script(
     mismatches: List[ValidationResult],
     language: str = "python"
@@ -489,84 +835,147 @@ def generate_migration_script(
         return f"# Unsupported language: {language}"
 
 
-def _generate_python_migration(mismatches: List[ValidationResult]) -> str:
-    """Generate Python migration script"""
-    lines = [
-        '"""',
-        'Type Migration Script',
-        'Generated by MCP Type Safety Skill',
-        '"""',
-        '',
-        'from datetime import datetime, timezone',
-        'from typing import Any, Union',
-        '',
-    ]
+_PY_HEADER = '''\
+"""
+Type Migration Script
+Generated by MCP Type Safety Skill
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Union
+'''
+
+_PY_CONVERT_ID = '''\
+def convert_id(value: Union[str, int]) -> int:
+    """Convert string ID to integer"""
+    if isinstance(value, int):
+        return value
+    return int(value)
+'''
+
+_PY_NORMALIZE_TIMESTAMP = '''\
+def normalize_timestamp(value, target_format="iso8601"):
+    """Convert any timestamp to target format"""
+    if isinstance(value, int):
+        # Unix timestamp (seconds or milliseconds)
+        if value > 1e11:  # Milliseconds
+            value = value / 1000
+        dt = datetime.fromtimestamp(value, tz=timezone.utc)
+    elif isinstance(value, str):
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    else:
+        raise ValueError(f"Cannot parse timestamp: {value}")
+
+    if target_format == "iso8601":
+        iso = dt.isoformat()
+        return iso[:-6] + "Z" if iso.endswith("+00:00") else iso
+    elif target_format == "unix_seconds":
+        return int(dt.timestamp())
+    elif target_format == "unix_ms":
+        return int(dt.timestamp() * 1000)
+    else:
+        raise ValueError(f"Unknown format: {target_format}")
+'''
+
+_PY_CONVERT_AMOUNT = '''\
+def convert_amount(value: str, from_cents: bool = True) -> float:
+    """Convert string amount to decimal"""
+    num = float(value)
+    if from_cents:
+        return num / 100
+    return num
+'''
+
+_PY_CONVERT_BOOLEAN = '''\
+def convert_boolean(value: Any) -> bool:
+    """Convert various boolean representations"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return value != 0
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes")
+    return bool(value)
+'''
+
+_JS_HEADER = '''\
+/**
+ * Type Migration Script
+ * Generated by MCP Type Safety Skill
+ */
+'''
+
+_JS_CONVERT_ID = '''\
+function convertId(value) {
+  return typeof value === "string" ? parseInt(value, 10) : value;
+}
+'''
+
+_JS_NORMALIZE_TIMESTAMP = '''\
+function normalizeTimestamp(value, targetFormat = "iso8601") {
+  let date;
+  if (typeof value === "number") {
+    // Unix timestamp (seconds or milliseconds)
+    const ms = value > 1e11 ? value : value * 1000;
+    date = new Date(ms);
+  } else if (typeof value === "string") {
+    date = new Date(value);
+  } else {
+    throw new Error(`Cannot parse timestamp: ${value}`);
+  }
+
+  switch (targetFormat) {
+    case "iso8601":
+      return date.toISOString();
+    case "unix_seconds":
+      return Math.floor(date.getTime() / 1000);
+    case "unix_ms":
+      return date.getTime();
+    default:
+      throw new Error(`Unknown format: ${targetFormat}`);
+  }
+}
+'''
+
+_JS_CONVERT_AMOUNT = '''\
+function convertAmount(value, fromCents = true) {
+  const num = parseFloat(value);
+  return fromCents ? num / 100 : num;
+}
+'''
 
-    # Collect unique conversions needed
+
+def _collect_conversions(mismatches: List[ValidationResult]) -> Tuple[set, bool]:
+    """
+    Collect unique (actual, expected) conversions in a single pass.
+    Returns: (conversions, whether any suggestion mentions a timestamp)
+    """
     conversions = set()
+    needs_timestamp = False
     for m in mismatches:
         conversions.add((m.actual_type, m.expected_type))
+        if not needs_timestamp and m.suggestion:
+            needs_timestamp = "timestamp" in str(m.suggestion).lower()
+    return conversions, needs_timestamp
 
-    # Generate conversion functions
+
+def _generate_python_migration(mismatches: List[ValidationResult]) -> str:
+    """Generate Python migration script"""
+    lines = [_PY_HEADER]
+    conversions, needs_timestamp = _collect_conversions(mismatches)
+
+    # Add the conversion functions needed
     if ("string", "integer") in conversions or ("integer", "string") in conversions:
-        lines.extend([
-            'def convert_id(value: Union[str, int]) -> int:',
-            '    """Convert string ID to integer"""',
-            '    if isinstance(value, int):',
-            '        return value',
-            '    return int(value)',
-            '',
-        ])
+        lines.append(_PY_CONVERT_ID)
 
-    if any("timestamp" in str(m.suggestion or "").lower() for m in mismatches):
-        lines.extend([
-            'def normalize_timestamp(value, target_format="iso8601"):',
-            '    """Convert any timestamp to target format"""',
-            '    if isinstance(value, int):',
-            '        # Unix timestamp (seconds or milliseconds)',
-            '        if value > 1e11:  # Milliseconds',
-            '            value = value / 1000',
-            '        dt = datetime.fromtimestamp(value, tz=timezone.utc)',
-            '    elif isinstance(value, str):',
-            '        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))',
-            '    else:',
-            '        raise ValueError(f"Cannot parse timestamp: {value}")',
-            '',
-            '    if target_format == "iso8601":',
-            '        return dt.isoformat().replace("+00:00", "Z")',
-            '    elif target_format == "unix_seconds":',
-            '        return int(dt.timestamp())',
-            '    elif target_format == "unix_ms":',
-            '        return int(dt.timestamp() * 1000)',
-            '    else:',
-            '        raise ValueError(f"Unknown format: {target_format}")',
-            '',
-        ])
+    if needs_timestamp:
+        lines.append(_PY_NORMALIZE_TIMESTAMP)
 
     if ("string", "number") in conversions:
-        lines.extend([
-            'def convert_amount(value: str, from_cents: bool = True) -> float:',
-            '    """Convert string amount to decimal"""',
-            '    num = float(value)',
-            '    if from_cents:',
-            '        return num / 100',
-            '    return num',
-            '',
-        ])
+        lines.append(_PY_CONVERT_AMOUNT)
 
     if ("string", "boolean") in conversions or ("integer", "boolean") in conversions:
-        lines.extend([
-            'def convert_boolean(value: Any) -> bool:',
-            '    """Convert various boolean representations"""',
-            '    if isinstance(value, bool):',
-            '        return value',
-            '    if isinstance(value, int):',
-            '        return value != 0',
-            '    if isinstance(value, str):',
-            '        return value.lower() in ("true", "1", "yes")',
-            '    return bool(value)',
-            '',
-        ])
+        lines.append(_PY_CONVERT_BOOLEAN)
 
     # Generate example usage
     lines.extend([
@@ -585,62 +994,17 @@ def _generate_python_migration(mismatches: List[ValidationResult]) -> str:
 
 def _generate_javascript_migration(mismatches: List[ValidationResult]) -> str:
     """Generate JavaScript migration script"""
-    lines = [
-        '/**',
-        ' * Type Migration Script',
-        ' * Generated by MCP Type Safety Skill',
-        ' */',
-        '',
-    ]
-
-    conversions = set()
-    for m in mismatches:
-        conversions.add((m.actual_type, m.expected_type))
+    lines = [_JS_HEADER]
+    conversions, needs_timestamp = _collect_conversions(mismatches)
 
     if ("string", "integer") in conversions:
-        lines.extend([
-            'function convertId(value) {',
-            '  return typeof value === "string" ? parseInt(value, 10) : value;',
-            '}',
-            '',
-        ])
+        lines.append(_JS_CONVERT_ID)
 
-    if any("timestamp" in str(m.suggestion or "").lower() for m in mismatches):
-        lines.extend([
-            'function normalizeTimestamp(value, targetFormat = "iso8601") {',
-            '  let date;',
-            '  if (typeof value === "number") {',
-            '    // Unix timestamp (seconds or milliseconds)',
-            '    const ms = value > 1e11 ? value : value * 1000;',
-            '    date = new Date(ms);',
-            '  } else if (typeof value === "string") {',
-            '    date = new Date(value);',
-            '  } else {',
-            '    throw new Error(`Cannot parse timestamp: ${value}`);',
-            '  }',
-            '',
-            '  switch (targetFormat) {',
-            '    case "iso8601":',
-            '      return date.toISOString();',
-            '    case "unix_seconds":',
-            '      return Math.floor(date.getTime() / 1000);',
-            '    case "unix_ms":',
-            '      return date.getTime();',
-            '    default:',
-            '      throw new Error(`Unknown format: ${targetFormat}`);',
-            '  }',
-            '}',
-            '',
-        ])
+    if needs_timestamp:
+        lines.append(_JS_NORMALIZE_TIMESTAMP)
 
     if ("string", "number") in conversions:
-        lines.extend([
-            'function convertAmount(value, fromCents = true) {',
-            '  const num = parseFloat(value);',
-            '  return fromCents ? num / 100 : num;',
-            '}',
-            '',
-        ])
+        lines.append(_JS_CONVERT_AMOUNT)
 
     lines.extend([
         '// Example usage:',
@@ -666,8 +1030,7 @@ def format_report_text(report: ValidationReport, tool_name: str) -> str:
 
     if report.errors:
         lines.append(f"❌ Found {len(report.errors)} error(s):")
-        for err in report.errors:
-            lines.append(f"   {err.field}: {err.message}")
+        lines.extend([f"   {err.field}: {err.message}" for err in report.errors])
         lines.append("")
 
     if report.warnings:
@@ -680,13 +1043,10 @@ def format_report_text(report: ValidationReport, tool_name: str) -> str:
 
     if report.suggestions:
         lines.append(f"💡 {len(report.suggestions)} suggestion(s):")
-        for sug in report.suggestions:
-            lines.append(f"   {sug.field}: {sug.suggestion or sug.message}")
+        lines.extend([f"   {sug.field}: {sug.suggestion or sug.message}" for sug in report.suggestions])
 
     if report.auto_fixes:
-        lines.append("")
-        lines.append("Corrected arguments:")
-        lines.append(json.dumps(report.auto_fixes, indent=2))
+        lines.extend(("", "Corrected arguments:", json.dumps(report.auto_fixes, indent=2)))
 
     return '\n'.join(lines)
 
@@ -714,15 +1074,16 @@ def format_session_report(stats: SessionStats) -> str:
     if patterns:
         patterns.sort(key=lambda x: x[1], reverse=True)
         lines.append("Most Common Issues:")
-        for i, (pattern, count) in enumerate(patterns[:3], 1):
-            name = pattern.replace("_", " ").title()
-            lines.append(f"  {i}. {name} ({count} occurrence{'s' if count > 1 else ''})")
+        lines.extend([
+            f"  {i}. {pattern.replace('_', ' ').title()} ({count} occurrence{'s' if count > 1 else ''})"
+            for i, (pattern, count) in enumerate(patterns[:3], 1)
+        ])
         lines.append("")
 
-    lines.extend([
+    lines.extend((
         "💡 Tip: For system-wide type safety, consider using MCP Universal Protocol.",
         "   It validates ALL MCP traffic, not just Claude's calls.",
         "   → https://github.com/ad8700/mcp-universal-protocol"
-    ])
+    ))
 
     return '\n'.join(lines)